@@ -1,13 +1,26 @@
-"""Package exposing models, loader, and ranking processors."""
-
-from .models import RankingRecord, RankingDataset
-from .loader import RankingsLoader
-from .processors import BaseRankingProcessor, WinnersLosersProcessor
-
-__all__ = [
-    "RankingRecord",
-    "RankingDataset",
-    "RankingsLoader",
-    "BaseRankingProcessor",
-    "WinnersLosersProcessor",
-]
+"""Package exposing models, loader, and ranking processors.
+
+Attributes are imported lazily on first access so that light entry points
+(e.g. the resident worker client) do not pay for the whole package.
+"""
+
+from importlib import import_module
+
+_EXPORTS = {
+    "RankingRecord": ".models",
+    "RankingDataset": ".models",
+    "RankingsLoader": ".loader",
+    "BaseRankingProcessor": ".processors",
+    "WinnersLosersProcessor": ".processors",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,99 @@
+"""Thin CLI client forwarding `main` arguments to a resident worker (see server.py).
+
+Accepts exactly the same arguments as `python -m pogo_gbl_analyzer.main`.
+Deliberately imports only a few small stdlib modules; when no worker is
+listening it falls back to running the analysis in-process.
+"""
+
+from __future__ import annotations
+import json
+import os
+import socket
+import stat
+import sys
+
+SOCKET_ENV = "POGO_GBL_SOCKET"
+
+
+def _private_dir() -> str:
+    """Per-user fallback directory, created 0700 by the server."""
+    return f"/tmp/pogo-gbl-analyzer-{os.getuid()}"
+
+
+def default_socket_path() -> str:
+    """$POGO_GBL_SOCKET, else a socket in a directory only this user can access."""
+    if os.environ.get(SOCKET_ENV):
+        return os.environ[SOCKET_ENV]
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return os.path.join(os.environ["XDG_RUNTIME_DIR"], "pogo-gbl-analyzer.sock")
+    return os.path.join(_private_dir(), "worker.sock")
+
+
+def untrusted_reason(path: str, check_socket: bool = True) -> str | None:
+    """Return why another user could control `path`, or None if it is safe.
+
+    The socket and its directory must be owned by us (the directory may also
+    be root's). The directory must not be writable by group / others unless it
+    is sticky like /tmp; the per-user fallback directory must be a real 0700
+    directory, so nobody else can swap the socket for their own.
+    """
+    uid = os.getuid()
+    parent = os.path.dirname(os.path.abspath(path))
+    if parent == _private_dir():
+        st = os.lstat(parent)
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != uid:
+            return f"{parent} is not a directory owned by us"
+        if stat.S_IMODE(st.st_mode) != 0o700:
+            return f"directory {parent} is not mode 0700"
+    else:
+        st = os.stat(parent)
+        if st.st_uid not in (uid, 0):
+            return f"directory {parent} is owned by another user"
+        if not st.st_mode & stat.S_ISVTX and st.st_mode & 0o022:
+            return f"directory {parent} is writable by other users"
+    if check_socket and os.stat(path).st_uid != uid:
+        return f"socket {path} is owned by another user"
+    return None
+
+
+def request(argv: list[str], socket_path: str | None = None) -> dict:
+    """Send one run request and return the worker's reply.
+
+    Reply keys: status (exit code), stdout, stderr.
+    """
+    socket_path = socket_path or default_socket_path()
+    reason = untrusted_reason(socket_path)
+    if reason:
+        raise PermissionError(f"Refusing to use worker socket: {reason}")
+    payload = json.dumps({"argv": list(argv), "cwd": os.getcwd()}).encode("utf-8")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(payload + b"\n")
+        sock.shutdown(socket.SHUT_WR)
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return json.loads(b"".join(chunks))
+
+
+def main():
+    argv = sys.argv[1:]
+    try:
+        reply = request(argv)
+    except PermissionError as exc:
+        raise SystemExit(str(exc))
+    except (FileNotFoundError, ConnectionRefusedError):
+        from .main import main as run_local
+
+        run_local()
+        return
+    sys.stdout.write(reply.get("stdout", ""))
+    sys.stderr.write(reply.get("stderr", ""))
+    sys.exit(reply.get("status", 1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+from __future__ import annotations
+import asyncio
+import contextlib
+import gzip
+import hashlib
+import http.client
+import json
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urljoin, urlsplit
+
+DEFAULT_CACHE_DIR = Path(".cache") / "rankings"
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+
+@dataclass(frozen=True)
+class FetchResult:
+    """Outcome of a conditional fetch.
+
+    path: local cache file holding the (decoded) CSV body.
+    validator: ETag or Last-Modified value identifying this version ("" if none).
+    not_modified: True when the server answered 304 and the cached copy was reused.
+    """
+
+    url: str
+    path: Path
+    validator: str
+    not_modified: bool
+
+
+class _HostPool:
+    """Keep-alive connections to a single (scheme, host, port)."""
+
+    def __init__(
+        self, scheme: str, host: str, port: Optional[int], size: int, timeout: float
+    ):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def acquire(self) -> http.client.HTTPConnection:
+        self._slots.acquire()
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        cls = (
+            http.client.HTTPSConnection
+            if self.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        return cls(self.host, self.port, timeout=self.timeout)
+
+    def release(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            self._idle.append(conn)
+        self._slots.release()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+class RankingsFetcher:
+    """Fetch ranking exports over pooled HTTP connections with a validator cache.
+
+    Each URL is stored under `cache_dir` as `<digest>.csv` plus a `<digest>.json`
+    holding its ETag / Last-Modified. Later fetches send If-None-Match /
+    If-Modified-Since so unchanged exports cost a single 304 round trip.
+
+    Blocking I/O runs in worker threads, so `fetch_many` downloads concurrently
+    while connections stay reusable across separate `asyncio.run` calls.
+    Redirects are followed (up to `max_redirects`) on the target host's pool;
+    the cache stays keyed by the URL that was asked for.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path = DEFAULT_CACHE_DIR,
+        max_connections_per_host: int = 6,
+        timeout: float = 30.0,
+        max_redirects: int = 5,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self._pools: Dict[Tuple[str, str, Optional[int]], _HostPool] = {}
+        self._pools_lock = threading.Lock()
+
+    def _pool_for(self, scheme: str, host: str, port: Optional[int]) -> _HostPool:
+        key = (scheme, host, port)
+        with self._pools_lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = _HostPool(
+                    scheme, host, port, self.max_connections_per_host, self.timeout
+                )
+                self._pools[key] = pool
+            return pool
+
+    def _cache_paths(self, url: str) -> Tuple[Path, Path]:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:24]
+        return self.cache_dir / f"{digest}.csv", self.cache_dir / f"{digest}.json"
+
+    def _read_meta(self, url: str) -> Optional[Dict[str, str]]:
+        body_path, meta_path = self._cache_paths(url)
+        if not body_path.exists() or not meta_path.exists():
+            return None
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return meta if meta.get("url") == url else None
+
+    def _write_cache(
+        self, url: str, body: bytes, etag: str, last_modified: str
+    ) -> Path:
+        body_path, meta_path = self._cache_paths(url)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        meta = {"url": url, "etag": etag, "last_modified": last_modified}
+        # Write-then-rename so concurrent readers never see a partial file; the
+        # temp name is unique per call, so concurrent writers never share one.
+        for path, data in (
+            (body_path, body),
+            (meta_path, json.dumps(meta).encode("utf-8")),
+        ):
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+            except BaseException:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(tmp)
+                raise
+        return body_path
+
+    def _get(
+        self, url: str, headers: Dict[str, str]
+    ) -> Tuple[int, http.client.HTTPMessage, bytes]:
+        parts = urlsplit(url)
+        pool = self._pool_for(parts.scheme, parts.hostname or "", parts.port)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        for attempt in range(2):
+            conn = pool.acquire()
+            try:
+                conn.request("GET", target, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read()
+            except (
+                http.client.RemoteDisconnected,
+                ConnectionResetError,
+                BrokenPipeError,
+            ):
+                # Server dropped an idle keep-alive connection; retry once on a fresh one.
+                conn.close()
+                if attempt:
+                    raise
+                continue
+            except BaseException:
+                conn.close()
+                raise
+            finally:
+                pool.release(conn)
+            return resp.status, resp.headers, body
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _get_following(
+        self, url: str, headers: Dict[str, str]
+    ) -> Tuple[int, http.client.HTTPMessage, bytes]:
+        target = url
+        for _ in range(self.max_redirects + 1):
+            status, resp_headers, body = self._get(target, headers)
+            if status not in REDIRECT_STATUSES:
+                return status, resp_headers, body
+            location = resp_headers.get("Location")
+            if not location:
+                raise OSError(f"GET {target} returned HTTP {status} without Location")
+            target = urljoin(target, location)
+        raise OSError(f"GET {url} exceeded {self.max_redirects} redirects")
+
+    def fetch_sync(self, url: str) -> FetchResult:
+        meta = self._read_meta(url)
+        headers = {"Accept-Encoding": "gzip", "User-Agent": "pogo-gbl-analyzer"}
+        if meta:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        status, resp_headers, body = self._get_following(url, headers)
+        body_path, _ = self._cache_paths(url)
+        if status == 304 and meta:
+            validator = meta.get("etag") or meta.get("last_modified") or ""
+            return FetchResult(url, body_path, validator, not_modified=True)
+        if status != 200:
+            raise OSError(f"GET {url} returned HTTP {status}")
+        if resp_headers.get("Content-Encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+        etag = resp_headers.get("ETag", "")
+        last_modified = resp_headers.get("Last-Modified", "")
+        path = self._write_cache(url, body, etag, last_modified)
+        return FetchResult(url, path, etag or last_modified, not_modified=False)
+
+    async def fetch(self, url: str) -> FetchResult:
+        return await asyncio.to_thread(self.fetch_sync, url)
+
+    async def fetch_many(self, urls: Sequence[str]) -> List[FetchResult]:
+        """Fetch `urls` concurrently; a URL listed more than once is requested once."""
+        unique = list(dict.fromkeys(urls))
+        results = await asyncio.gather(*(self.fetch(u) for u in unique))
+        by_url = dict(zip(unique, results))
+        return [by_url[u] for u in urls]
+
+    def close(self) -> None:
+        with self._pools_lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.close()
+
+    def __enter__(self) -> "RankingsFetcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def main():
+    import argparse
+
+    p = argparse.ArgumentParser(
+        description="Fetch ranking CSV exports into the local cache (concurrently)."
+    )
+    p.add_argument("urls", nargs="+", help="http(s) URLs of ranking CSV exports")
+    p.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR)
+    args = p.parse_args()
+    with RankingsFetcher(cache_dir=args.cache_dir) as fetcher:
+        results = asyncio.run(fetcher.fetch_many(args.urls))
+    for res in results:
+        state = "not modified" if res.not_modified else "fetched"
+        print(f"[{state}] {res.url} -> {res.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,34 +1,124 @@
 from __future__ import annotations
 import csv
 from pathlib import Path
-from typing import Dict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
 from .models import RankingRecord, RankingDataset
 
+if TYPE_CHECKING:  # asyncio / http.client are only imported when a URL is loaded
+    from .fetcher import FetchResult, RankingsFetcher
+
+
+def is_url(source: str | Path) -> bool:
+    """Return True when `source` is an http(s) URL rather than a local path."""
+    return isinstance(source, str) and source.lower().startswith(
+        ("http://", "https://")
+    )
+
 
 class RankingsLoader:
-    """Load ranking CSV exports into in-memory datasets."""
+    """Load ranking CSV exports (local paths or http(s) URLs) into in-memory datasets.
+
+    URLs are fetched through `fetcher` (created on first use). A dataset parsed
+    from a URL is kept in memory together with its ETag / Last-Modified, so a
+    304 answer returns the already-parsed dataset without touching the CSV.
+    """
 
     REQUIRED_COLUMNS = {"Pokemon", "Score"}
 
-    def load_csv(self, path: str | Path, league: str) -> RankingDataset:
-        path = Path(path)
-        with path.open(newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            missing = self.REQUIRED_COLUMNS - set(reader.fieldnames or [])
-            if missing:
-                raise ValueError(f"Missing required columns {missing} in {path}")
-            records: Dict[str, RankingRecord] = {}
-            for row in reader:
-                try:
-                    score = float(row["Score"]) if row.get("Score") else 0.0
-                except ValueError:
-                    continue
-                pokemon = row["Pokemon"].strip()
-                rec = RankingRecord(
-                    pokemon=pokemon,
-                    score=score,
-                    rank=len(records) + 1,  # 1-based order as encountered
-                    raw=row,
-                )
-                records[rec.name_key] = rec
+    def __init__(self, fetcher: Optional[RankingsFetcher] = None):
+        self.fetcher = fetcher
+        self._parsed: Dict[Tuple[str, str], Tuple[str, RankingDataset]] = {}
+
+    def _parse(
+        self, lines: Iterable[str], source: str | Path, league: str
+    ) -> RankingDataset:
+        reader = csv.DictReader(lines)
+        missing = self.REQUIRED_COLUMNS - set(reader.fieldnames or [])
+        if missing:
+            raise ValueError(f"Missing required columns {missing} in {source}")
+        records: Dict[str, RankingRecord] = {}
+        for row in reader:
+            try:
+                score = float(row["Score"]) if row.get("Score") else 0.0
+            except ValueError:
+                continue
+            pokemon = row["Pokemon"].strip()
+            rec = RankingRecord(
+                pokemon=pokemon,
+                score=score,
+                rank=len(records) + 1,  # 1-based order as encountered
+                raw=row,
+            )
+            records[rec.name_key] = rec
         return RankingDataset(league=league, records=records)
+
+    def _load_path(
+        self, path: str | Path, league: str, source: str | Path
+    ) -> RankingDataset:
+        with Path(path).open(newline="", encoding="utf-8") as f:
+            return self._parse(f, source, league)
+
+    def load_csv(self, path: str | Path, league: str) -> RankingDataset:
+        if is_url(path):
+            import asyncio
+
+            return asyncio.run(self.load_csv_async(path, league))
+        return self._load_path(path, league, path)
+
+    def _get_fetcher(self) -> RankingsFetcher:
+        if self.fetcher is None:
+            from .fetcher import RankingsFetcher
+
+            self.fetcher = RankingsFetcher()
+        return self.fetcher
+
+    async def load_csv_async(self, source: str | Path, league: str) -> RankingDataset:
+        if not is_url(source):
+            return self._load_path(source, league, source)
+        result = await self._get_fetcher().fetch(str(source))
+        return self._from_fetch(result, league, source)
+
+    def _from_fetch(
+        self, result: FetchResult, league: str, source: str | Path
+    ) -> RankingDataset:
+        key = (result.url, league)
+        cached = self._parsed.get(key)
+        if (
+            cached
+            and result.not_modified
+            and result.validator
+            and cached[0] == result.validator
+        ):
+            return cached[1]
+        ds = self._load_path(result.path, league, source)
+        self._parsed[key] = (result.validator, ds)
+        return ds
+
+    async def load_many_async(
+        self, sources: Sequence[Tuple[str | Path, str]]
+    ) -> List[RankingDataset]:
+        urls = [str(src) for src, _ in sources if is_url(src)]
+        fetched = await self._get_fetcher().fetch_many(urls) if urls else []
+        results = dict(zip(urls, fetched))
+        # Each distinct URL is fetched once and each (URL, league) parsed once.
+        datasets: Dict[Tuple[str, str], RankingDataset] = {}
+        loaded: List[RankingDataset] = []
+        for src, league in sources:
+            if not is_url(src):
+                loaded.append(self._load_path(src, league, src))
+                continue
+            key = (str(src), league)
+            if key not in datasets:
+                datasets[key] = self._from_fetch(results[str(src)], league, src)
+            loaded.append(datasets[key])
+        return loaded
+
+    def load_many(
+        self, sources: Sequence[Tuple[str | Path, str]]
+    ) -> List[RankingDataset]:
+        """Load several (source, league) pairs; URLs are fetched concurrently."""
+        if not any(is_url(src) for src, _ in sources):
+            return [self._load_path(src, league, src) for src, league in sources]
+        import asyncio
+
+        return asyncio.run(self.load_many_async(sources))
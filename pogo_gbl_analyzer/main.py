@@ -1,14 +1,9 @@
 from __future__ import annotations
 import argparse
-from datetime import datetime, UTC
 from pathlib import Path
+from typing import List, Optional
 from .loader import RankingsLoader
-from .processors import (
-    MoveSetChangesProcessor,
-    TypeTrendsProcessor,
-    WinnersLosersProcessor,
-    RankShiftProcessor,
-)
+from .processors import PROCESSORS, load_processor
 
 LEAGUE_ALIASES = {
     "great": "great",
@@ -23,10 +18,13 @@ LEAGUE_ALIASES = {
 }
 
 
-def parse_args():
-    p = argparse.ArgumentParser(description="Compare PvPoke ranking CSV exports.")
-    p.add_argument("old", type=Path, help="Old rankings CSV file")
-    p.add_argument("new", type=Path, help="New rankings CSV file")
+def parse_args(argv: Optional[List[str]] = None):
+    p = argparse.ArgumentParser(
+        prog="python -m pogo_gbl_analyzer.main",
+        description="Compare PvPoke ranking CSV exports.",
+    )
+    p.add_argument("old", help="Old rankings CSV file or http(s) URL")
+    p.add_argument("new", help="New rankings CSV file or http(s) URL")
     p.add_argument(
         "league",
         help="League identifier: great|ultra|master (aliases: 1500,2500,10000)",
@@ -36,7 +34,11 @@ def parse_args():
         "--analyze-top-n",
         type=int,
         default=None,
-        help="Limit analysis to top N of NEW snapshot (winners/movesets). If omitted, use all.",
+        help=(
+            "Limit analysis to the top N Pokémon: of NEW (winners/movesets), of BOTH "
+            "snapshots (types/combos/matchups), or of the first or last snapshot "
+            "(clusters). If omitted, use all."
+        ),
     )
     p.add_argument(
         "--output-top-n",
@@ -52,17 +54,53 @@ def parse_args():
     )
     p.add_argument(
         "--processor",
-        choices=["winners", "movesets", "types", "ranks"],
+        choices=list(PROCESSORS),
         default="winners",
         help=(
             "Select analysis: "
             "winners (score deltas), "
             "movesets (move set changes among top N by new score), "
             "types (aggregate rising/falling types), "
-            "ranks (rank position shifts)."
+            "ranks (rank position shifts), "
+            "combos (move combination usage trends), "
+            "matchups (type effectiveness pressure vs the meta), "
+            "clusters (groups of Pokémon that moved together)."
         ),
     )
-    return p.parse_args()
+    p.add_argument(
+        "--score-weighted",
+        action="store_true",
+        help="Weight each Pokémon by its Score instead of counting it once (combos).",
+    )
+    p.add_argument(
+        "--move-types",
+        type=Path,
+        default=None,
+        help="CSV with Move,Type columns; matchups then uses move types for attackers.",
+    )
+    p.add_argument(
+        "--snapshot",
+        action="append",
+        default=[],
+        help="Intermediate snapshot between OLD and NEW, oldest first; repeatable (clusters).",
+    )
+    p.add_argument(
+        "--numeric-field",
+        action="append",
+        default=[],
+        help="Numeric CSV column whose per-snapshot delta is an extra clustering feature; repeatable (clusters).",
+    )
+    args = p.parse_args(argv)
+    if args.score_weighted and args.processor != "combos":
+        p.error("--score-weighted is only used by --processor combos")
+    if args.move_types and args.processor != "matchups":
+        p.error("--move-types is only used by --processor matchups")
+    if args.processor != "clusters":
+        if args.snapshot:
+            p.error("--snapshot is only used by --processor clusters")
+        if args.numeric_field:
+            p.error("--numeric-field is only used by --processor clusters")
+    return args
 
 
 def normalize_league(value: str) -> str:
@@ -72,45 +110,87 @@ def normalize_league(value: str) -> str:
     return LEAGUE_ALIASES[key]
 
 
-def main():
-    args = parse_args()
+def run(
+    argv: Optional[List[str]] = None, loader: Optional[RankingsLoader] = None
+) -> Path:
+    """Parse `argv`, run the selected processor and return the written report path.
+
+    Only the selected processor module is imported. A long-lived `loader`
+    (see `server.py`) keeps datasets warm between runs.
+    """
+    args = parse_args(argv)
     league = normalize_league(args.league)
 
-    loader = RankingsLoader()
-    old_ds = loader.load_csv(args.old, league)
-    new_ds = loader.load_csv(args.new, league)
+    if loader is None:
+        loader = RankingsLoader()
+    sources = [args.old, *args.snapshot, args.new]
+    snapshots = loader.load_many([(src, league) for src in sources])
+    old_ds, new_ds = snapshots[0], snapshots[-1]
 
+    processor_cls = load_processor(args.processor)
     if args.processor == "winners":
-        processor = WinnersLosersProcessor(
+        processor = processor_cls(
             analyze_top_n=args.analyze_top_n,
             output_top_n=args.output_top_n,
             min_abs_delta=args.min_delta,
         )
     elif args.processor == "movesets":
-        processor = MoveSetChangesProcessor(
+        processor = processor_cls(
             analyze_top_n=args.analyze_top_n if args.analyze_top_n else 50,
             output_top_n=args.output_top_n,
         )
     elif args.processor == "types":
-        processor = TypeTrendsProcessor(
+        processor = processor_cls(
             output_top_n=args.output_top_n,
             min_abs_delta=args.min_delta,
             analyze_top_n=args.analyze_top_n,
         )
     elif args.processor == "ranks":
-        processor = RankShiftProcessor(
+        processor = processor_cls(
             analyze_top_n=args.analyze_top_n,
             output_top_n=args.output_top_n,
             min_rank_delta=int(args.min_delta) if args.min_delta else 1,
         )
-    report = processor.process(old_ds, new_ds)
+    elif args.processor == "combos":
+        processor = processor_cls(
+            output_top_n=args.output_top_n,
+            min_abs_delta=args.min_delta,
+            analyze_top_n=args.analyze_top_n,
+            weight_by_score=args.score_weighted,
+        )
+    elif args.processor == "matchups":
+        from .processors.type_matchups import load_move_types
+
+        processor = processor_cls(
+            output_top_n=args.output_top_n,
+            analyze_top_n=args.analyze_top_n,
+            move_types=load_move_types(args.move_types) if args.move_types else None,
+        )
+    elif args.processor == "clusters":
+        processor = processor_cls(
+            output_top_n=args.output_top_n,
+            min_abs_delta=args.min_delta,
+            analyze_top_n=args.analyze_top_n,
+            numeric_fields=args.numeric_field,
+        )
+    if args.processor == "clusters":
+        report = processor.process_series(snapshots)
+    else:
+        report = processor.process(old_ds, new_ds)
     # Write to output directory
+    from datetime import datetime, UTC
+
     out_dir = Path("output")
     out_dir.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
     filename = f"{league}_{args.processor}_{timestamp}.txt"
     out_path = out_dir / filename
     out_path.write_text(report, encoding="utf-8")
+    return out_path
+
+
+def main():
+    out_path = run()
     print(f"[written] {out_path}")
 
 
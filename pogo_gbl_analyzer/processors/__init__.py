@@ -1,13 +1,39 @@
-from .base import BaseRankingProcessor
-from .move_changes import MoveSetChangesProcessor
-from .type_trends import TypeTrendsProcessor
-from .winners_losers import WinnersLosersProcessor
-from .rank_shift import RankShiftProcessor
-
-__all__ = [
-    "BaseRankingProcessor",
-    "MoveSetChangesProcessor",
-    "TypeTrendsProcessor",
-    "WinnersLosersProcessor",
-    "RankShiftProcessor",
-]
+"""Ranking processors, imported lazily through a registry keyed by CLI name."""
+
+from importlib import import_module
+
+# --processor name -> (module, class); only the selected module is imported.
+PROCESSORS = {
+    "winners": (".winners_losers", "WinnersLosersProcessor"),
+    "movesets": (".move_changes", "MoveSetChangesProcessor"),
+    "types": (".type_trends", "TypeTrendsProcessor"),
+    "ranks": (".rank_shift", "RankShiftProcessor"),
+    "combos": (".move_combos", "MoveComboTrendsProcessor"),
+    "matchups": (".type_matchups", "TypeMatchupProcessor"),
+    "clusters": (".comovement", "CoMovementProcessor"),
+}
+
+_EXPORTS = {cls: module for module, cls in PROCESSORS.values()}
+_EXPORTS["BaseRankingProcessor"] = ".base"
+
+__all__ = ["PROCESSORS", "load_processor", *_EXPORTS]
+
+
+def load_processor(name: str):
+    """Return the processor class registered under `name` (e.g. "winners")."""
+    try:
+        module, cls = PROCESSORS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown processor '{name}'. Use one of: {', '.join(PROCESSORS)}"
+        ) from None
+    return getattr(import_module(module, __name__), cls)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
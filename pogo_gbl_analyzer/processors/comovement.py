@@ -0,0 +1,239 @@
+from __future__ import annotations
+import math
+from collections import defaultdict
+from itertools import product
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from ..models import RankingDataset, RankingRecord
+
+
+class CoMovementProcessor:
+    """Group Pokémon whose score / rank trajectories moved together.
+
+    Feature vector per Pokémon (present in every snapshot), one block per
+    consecutive snapshot pair: score delta, rank delta (positive = climbed) and
+    the delta of each column in `numeric_fields`. Each dimension is scaled to
+    unit standard deviation; `radius` is a per-feature RMS distance in standard
+    deviations (the Euclidean threshold is radius * sqrt(dimensions)).
+
+    Neighbours are found by hashing points onto a grid of `radius`-sized cells
+    over (up to) the first three dimensions and comparing only points in
+    adjacent cells, so there is no all-pairs loop. Clusters are seeded from the
+    biggest movers down: each still-unassigned Pokémon claims its unassigned
+    neighbours. Clusters are ranked by mean score trajectory magnitude.
+
+    output_top_n: number of clusters to show.
+    min_abs_delta: ignore Pokémon whose largest per-step score change is below this.
+    analyze_top_n: restrict to Pokémon in the top N of the first or last snapshot.
+    radius: neighbourhood radius, RMS standard deviations per feature.
+    min_cluster_size: smallest cluster reported.
+    numeric_fields: extra numeric CSV columns whose per-step deltas are features
+      (empty cells count as 0; unknown columns or non-numeric cells raise ValueError).
+    """
+
+    GRID_DIMS = 3
+    MEMBERS_SHOWN = 10
+
+    def __init__(
+        self,
+        output_top_n: int = 10,
+        min_abs_delta: float = 0.1,
+        analyze_top_n: Optional[int] = None,
+        radius: float = 0.25,
+        min_cluster_size: int = 3,
+        numeric_fields: Sequence[str] = (),
+    ):
+        self.output_top_n = output_top_n
+        self.min_abs_delta = min_abs_delta
+        self.analyze_top_n = analyze_top_n
+        self.radius = radius
+        self.min_cluster_size = min_cluster_size
+        self.numeric_fields = list(numeric_fields)
+
+    def _top_keys(self, ds: RankingDataset) -> Set[str]:
+        ranked = sorted(ds.records.values(), key=lambda r: r.score, reverse=True)
+        return {r.name_key for r in ranked[: self.analyze_top_n]}
+
+    def _check_fields(self, snapshots: Sequence[RankingDataset]) -> None:
+        for i, s in enumerate(snapshots, 1):
+            first = next(iter(s.records.values()), None)
+            columns = set(first.raw) if first is not None else set()
+            missing = [f for f in self.numeric_fields if f not in columns]
+            if missing:
+                raise ValueError(f"Missing numeric columns {missing} in snapshot {i}")
+
+    @staticmethod
+    def _number(rec: RankingRecord, field: str) -> float:
+        value = (rec.raw.get(field) or "").strip()
+        if not value:
+            return 0.0  # empty cell
+        try:
+            return float(value)
+        except ValueError:
+            raise ValueError(
+                f"Non-numeric {field!r} value {value!r} for {rec.pokemon}"
+            ) from None
+
+    def features(
+        self, snapshots: Sequence[RankingDataset]
+    ) -> Tuple[List[str], List[List[float]], List[List[float]]]:
+        """Return (keys, raw feature vectors, per-step score deltas)."""
+        self._check_fields(snapshots)
+        keys = [
+            k for k in snapshots[-1].records if all(k in s.records for s in snapshots)
+        ]
+        if self.analyze_top_n is not None:
+            scope = self._top_keys(snapshots[0]) | self._top_keys(snapshots[-1])
+            keys = [k for k in keys if k in scope]
+
+        kept: List[str] = []
+        vectors: List[List[float]] = []
+        score_steps: List[List[float]] = []
+        for key in keys:
+            recs = [s.records[key] for s in snapshots]
+            steps = [b.score - a.score for a, b in zip(recs, recs[1:])]
+            if max(abs(d) for d in steps) < self.min_abs_delta:
+                continue
+            vec: List[float] = []
+            for (a, b), d in zip(zip(recs, recs[1:]), steps):
+                vec.append(d)
+                vec.append(float(a.rank - b.rank))
+                for f in self.numeric_fields:
+                    vec.append(self._number(b, f) - self._number(a, f))
+            kept.append(key)
+            vectors.append(vec)
+            score_steps.append(steps)
+        return kept, vectors, score_steps
+
+    @staticmethod
+    def _standardize(vectors: List[List[float]]) -> List[Tuple[float, ...]]:
+        if not vectors:
+            return []
+        n = len(vectors)
+        cols = list(zip(*vectors))
+        scales = []
+        for col in cols:
+            mean = sum(col) / n
+            std = math.sqrt(sum((v - mean) ** 2 for v in col) / n)
+            scales.append((mean, std or 1.0))
+        return [tuple((v - m) / s for v, (m, s) in zip(vec, scales)) for vec in vectors]
+
+    def neighbours(self, points: Sequence[Tuple[float, ...]]) -> List[List[int]]:
+        """Indices of all points within the radius of each point (grid-blocked)."""
+        if not points:
+            return []
+        dims = min(self.GRID_DIMS, len(points[0]))
+        # Any single coordinate differs by at most the full distance, so cells of
+        # size r over the blocked dims are guaranteed to contain every neighbour.
+        r = self.radius * math.sqrt(len(points[0]))
+        cells: Dict[Tuple[int, ...], List[int]] = defaultdict(list)
+        for i, p in enumerate(points):
+            cells[tuple(math.floor(p[d] / r) for d in range(dims))].append(i)
+        offsets = list(product((-1, 0, 1), repeat=dims))
+        result: List[List[int]] = [[] for _ in points]
+        dist = math.dist
+        for cell, members in cells.items():
+            candidates: List[int] = []
+            for off in offsets:
+                candidates.extend(
+                    cells.get(tuple(c + o for c, o in zip(cell, off)), ())
+                )
+            for i in members:
+                p = points[i]
+                result[i] = [
+                    j for j in candidates if j != i and dist(p, points[j]) <= r
+                ]
+        return result
+
+    def clusters(
+        self, neighbours: List[List[int]], order: Sequence[int]
+    ) -> List[List[int]]:
+        """Leader clustering: each unassigned point in `order` claims its free neighbours.
+
+        Clusters therefore never chain (diameter <= 2 * radius); a leader whose
+        group would be smaller than `min_cluster_size` claims nothing.
+        """
+        assigned = [False] * len(neighbours)
+        groups: List[List[int]] = []
+        for leader in order:
+            if assigned[leader]:
+                continue
+            group = [leader] + [j for j in neighbours[leader] if not assigned[j]]
+            if len(group) < self.min_cluster_size:
+                continue  # leave these free to join a later leader
+            for j in group:
+                assigned[j] = True
+            groups.append(group)
+        return groups
+
+    def process(self, old: RankingDataset, new: RankingDataset) -> str:
+        return self.process_series([old, new])
+
+    def process_series(self, snapshots: Sequence[RankingDataset]) -> str:
+        if len(snapshots) < 2:
+            raise ValueError("At least two snapshots are required")
+        keys, vectors, score_steps = self.features(snapshots)
+        points = self._standardize(vectors)
+        nbrs = self.neighbours(points)
+        totals = [sum(steps) for steps in score_steps]
+        magnitude = [math.hypot(*steps) for steps in score_steps]
+        movers = sorted(range(len(keys)), key=lambda i: magnitude[i], reverse=True)
+        groups = self.clusters(nbrs, movers)
+
+        summaries: List[Tuple[float, List[int]]] = []
+        for g in groups:
+            shift = sum(magnitude[i] for i in g) / len(g)
+            summaries.append((shift, g))
+        summaries.sort(key=lambda x: x[0], reverse=True)
+
+        clustered = sum(len(g) for g in groups)
+        scope_suffix = (
+            f" (top {self.analyze_top_n})" if self.analyze_top_n is not None else ""
+        )
+        features = "score/rank deltas" + (
+            " + " + ", ".join(self.numeric_fields) if self.numeric_fields else ""
+        )
+        lines: List[str] = [
+            f"League: {snapshots[-1].league}",
+            f"Co-Movement Clusters across {len(snapshots)} snapshots{scope_suffix}",
+            f"Candidates: {len(keys)} (min abs delta {self.min_abs_delta:.2f}; features: {features})",
+            f"Clusters: {len(groups)} (radius {self.radius:.2f} std/feature, min size {self.min_cluster_size}); "
+            f"unclustered: {len(keys) - clustered}",
+        ]
+
+        for n, (shift, g) in enumerate(summaries[: self.output_top_n], start=1):
+            steps = len(score_steps[g[0]])
+            mean_steps = [
+                sum(score_steps[i][s] for i in g) / len(g) for s in range(steps)
+            ]
+            mean_rank = sum(
+                snapshots[0].records[keys[i]].rank - snapshots[-1].records[keys[i]].rank
+                for i in g
+            ) / len(g)
+            members = sorted(g, key=lambda i: abs(totals[i]), reverse=True)
+            shown = ", ".join(
+                f"{keys[i]} ({totals[i]:+.1f})" for i in members[: self.MEMBERS_SHOWN]
+            )
+            more = len(members) - self.MEMBERS_SHOWN
+            lines.append("")
+            lines.append(
+                f"{n:2d}. {len(g)} Pokémon, mean shift {shift:.2f} "
+                f"(score steps {' / '.join(f'{d:+.2f}' for d in mean_steps)}; "
+                f"mean rank change {mean_rank:+.1f})"
+            )
+            lines.append(f"    {shown}{f' ... +{more} more' if more > 0 else ''}")
+
+        if len(summaries) > self.output_top_n:
+            lines.append("")
+            lines.append(
+                f"(Truncated to {self.output_top_n} clusters out of {len(summaries)})"
+            )
+
+        lines.append("")
+        lines.append("Nearest Neighbours of Biggest Movers")
+        for i in movers[:5]:
+            near = sorted(nbrs[i], key=lambda j: math.dist(points[i], points[j]))[:3]
+            near_txt = (
+                ", ".join(keys[j] for j in near) if near else "(none within radius)"
+            )
+            lines.append(f"{totals[i]:+6.2f} {keys[i]}: {near_txt}")
+        return "\n".join(lines)
@@ -0,0 +1,169 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Tuple
+from ..models import RankingDataset, RankingRecord
+
+# Move ids are packed into one int key per combo (20 bits per move id; 0 = no move).
+_SHIFT = 20
+
+
+@dataclass
+class ComboCounts:
+    """Sparse combo tallies for one snapshot, keyed by packed move ids.
+
+    weights: per-combo weight (row count, or summed Score when weighted).
+    counts: per-combo row count.
+    total: total weight of counted rows (the usage-rate denominator).
+    """
+
+    total: float = 0.0
+    weights: Dict[int, float] = field(default_factory=dict)
+    counts: Dict[int, int] = field(default_factory=dict)
+
+    def add(self, key: int, weight: float) -> None:
+        self.weights[key] = self.weights.get(key, 0.0) + weight
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+
+class MoveComboTrendsProcessor:
+    """Report move combinations whose usage changed most across the meta.
+
+    Three combo kinds are tallied per snapshot: fast + charged pairs, charged +
+    charged pairs (unordered), and full move sets. Usage is the share of rows
+    (or of total Score when `weight_by_score`) that run the combo, compared in
+    percentage points between snapshots.
+
+    Move names are interned to small integer ids shared by both snapshots and
+    each combo is packed into a single int key, so counting is a handful of
+    dict updates per row regardless of how many snapshots are tallied.
+
+    Parameters:
+      output_top_n: rising / falling combos shown per kind.
+      min_abs_delta: minimum usage change (percentage points) to include.
+      analyze_top_n: restrict BOTH snapshots to their top N by score.
+      weight_by_score: weight each row by its Score instead of counting it once.
+    """
+
+    FAST_FIELD = "Fast Move"
+    CHARGED_FIELDS = ["Charged Move 1", "Charged Move 2"]
+    KINDS = ["Fast + Charged", "Charged + Charged", "Full Move Set"]
+
+    def __init__(
+        self,
+        output_top_n: int = 10,
+        min_abs_delta: float = 0.1,
+        analyze_top_n: int | None = None,
+        weight_by_score: bool = False,
+    ):
+        self.output_top_n = output_top_n
+        self.min_abs_delta = min_abs_delta
+        self.analyze_top_n = analyze_top_n
+        self.weight_by_score = weight_by_score
+        self._move_ids: Dict[str, int] = {}
+        self._move_names: List[str] = [""]
+
+    def _intern(self, move: str) -> int:
+        move = move.strip()
+        if not move:
+            return 0
+        mid = self._move_ids.get(move)
+        if mid is None:
+            mid = self._move_ids[move] = len(self._move_names)
+            self._move_names.append(move)
+        return mid
+
+    def _scope(self, ds: RankingDataset) -> Iterable[RankingRecord]:
+        if self.analyze_top_n is None:
+            return ds.records.values()
+        return sorted(ds.records.values(), key=lambda r: r.score, reverse=True)[
+            : self.analyze_top_n
+        ]
+
+    def count(self, ds: RankingDataset) -> Tuple[ComboCounts, ComboCounts, ComboCounts]:
+        """Tally (fast+charged, charged+charged, full move set) combos for one snapshot."""
+        fast_charged, charged_pairs, full = ComboCounts(), ComboCounts(), ComboCounts()
+        intern = self._intern
+        c1_field, c2_field = self.CHARGED_FIELDS
+        for rec in self._scope(ds):
+            raw = rec.raw
+            fast = intern(raw.get(self.FAST_FIELD) or "")
+            a = intern(raw.get(c1_field) or "")
+            b = intern(raw.get(c2_field) or "")
+            if not fast and not a and not b:
+                continue
+            if a > b:
+                a, b = b, a  # charged moves are unordered
+            w = rec.score if self.weight_by_score else 1.0
+            for tally in (fast_charged, charged_pairs, full):
+                tally.total += w
+            if fast:
+                if a:
+                    fast_charged.add((fast << _SHIFT) | a, w)
+                if b and b != a:
+                    fast_charged.add((fast << _SHIFT) | b, w)
+            if a and b:
+                charged_pairs.add((a << _SHIFT) | b, w)
+            full.add((((fast << _SHIFT) | a) << _SHIFT) | b, w)
+        return fast_charged, charged_pairs, full
+
+    def _label(self, kind: int, key: int) -> str:
+        mask = (1 << _SHIFT) - 1
+        names = self._move_names
+        if kind == 0:
+            return f"{names[key >> _SHIFT]} + {names[key & mask]}"
+        if kind == 1:
+            return " / ".join(sorted((names[key >> _SHIFT], names[key & mask])))
+        fast = names[key >> (2 * _SHIFT)] or "?"
+        charged = sorted(
+            n for n in (names[(key >> _SHIFT) & mask], names[key & mask]) if n
+        )
+        return f"{fast} | {' / '.join(charged) or '?'}"
+
+    def process(self, old: RankingDataset, new: RankingDataset) -> str:
+        old_counts = self.count(old)
+        new_counts = self.count(new)
+
+        weighting = "score-weighted" if self.weight_by_score else "row count"
+        scope_suffix = (
+            f" (top {self.analyze_top_n})" if self.analyze_top_n is not None else ""
+        )
+        lines: List[str] = [
+            f"League: {new.league}",
+            f"Move Combo Trends (usage share, {weighting}){scope_suffix}",
+            f"Min abs delta filter: {self.min_abs_delta:.2f} pp",
+        ]
+
+        for kind, (o, n) in enumerate(zip(old_counts, new_counts)):
+            o_scale = 100.0 / o.total if o.total else 0.0
+            n_scale = 100.0 / n.total if n.total else 0.0
+            deltas: List[Tuple[int, float, float, float]] = []
+            for key in o.weights.keys() | n.weights.keys():
+                o_share = o.weights.get(key, 0.0) * o_scale
+                n_share = n.weights.get(key, 0.0) * n_scale
+                delta = n_share - o_share
+                if abs(delta) >= self.min_abs_delta:
+                    deltas.append((key, o_share, n_share, delta))
+
+            # Ties broken by label so reports are stable between runs.
+            rising = sorted(
+                (d for d in deltas if d[3] > 0),
+                key=lambda x: (-x[3], self._label(kind, x[0])),
+            )
+            falling = sorted(
+                (d for d in deltas if d[3] < 0),
+                key=lambda x: (x[3], self._label(kind, x[0])),
+            )
+
+            lines.append("")
+            lines.append(f"== {self.KINDS[kind]} ({len(n.weights)} distinct in new) ==")
+            for title, rows in (("Rising", rising), ("Falling", falling)):
+                shown = rows[: self.output_top_n]
+                lines.append(f"{title} ({len(shown)} of {len(rows)})")
+                for key, o_share, n_share, delta in shown:
+                    lines.append(
+                        f"{delta:+6.2f} pp {self._label(kind, key)} "
+                        f"(usage {o_share:.2f}% -> {n_share:.2f}%; "
+                        f"count {o.counts.get(key, 0)} -> {n.counts.get(key, 0)})"
+                    )
+
+        return "\n".join(lines)
@@ -0,0 +1,289 @@
+from __future__ import annotations
+import csv
+from itertools import combinations
+from operator import mul
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+from ..models import RankingDataset, RankingRecord
+
+TYPES: Tuple[str, ...] = (
+    "normal", "fire", "water", "electric", "grass", "ice",
+    "fighting", "poison", "ground", "flying", "psychic", "bug",
+    "rock", "ghost", "dragon", "dark", "steel", "fairy",
+)  # fmt: skip
+TYPE_INDEX: Dict[str, int] = {t: i for i, t in enumerate(TYPES)}
+
+# Pokémon GO damage multipliers.
+SUPER_EFFECTIVE = 1.6
+NOT_VERY_EFFECTIVE = 0.625
+IMMUNE = 0.390625
+
+_SUPER = {
+    "fire": "grass ice bug steel",
+    "water": "fire ground rock",
+    "electric": "water flying",
+    "grass": "water ground rock",
+    "ice": "grass ground flying dragon",
+    "fighting": "normal ice rock dark steel",
+    "poison": "grass fairy",
+    "ground": "fire electric poison rock steel",
+    "flying": "grass fighting bug",
+    "psychic": "fighting poison",
+    "bug": "grass psychic dark",
+    "rock": "fire ice flying bug",
+    "ghost": "psychic ghost",
+    "dragon": "dragon",
+    "dark": "psychic ghost",
+    "steel": "ice rock fairy",
+    "fairy": "fighting dragon dark",
+}
+_RESISTED = {
+    "normal": "rock steel",
+    "fire": "fire water rock dragon",
+    "water": "water grass dragon",
+    "electric": "electric grass dragon",
+    "grass": "fire grass poison flying bug dragon steel",
+    "ice": "fire water ice steel",
+    "fighting": "poison flying psychic bug fairy",
+    "poison": "poison ground rock ghost",
+    "ground": "grass bug",
+    "flying": "electric rock steel",
+    "psychic": "psychic steel",
+    "bug": "fire fighting poison flying ghost steel fairy",
+    "rock": "fighting ground steel",
+    "ghost": "dark",
+    "dragon": "steel",
+    "dark": "fighting dark fairy",
+    "steel": "fire water electric steel",
+    "fairy": "fire poison steel",
+}
+_IMMUNE = {
+    "normal": "ghost",
+    "electric": "ground",
+    "fighting": "ghost",
+    "poison": "steel",
+    "ground": "flying",
+    "psychic": "dark",
+    "ghost": "normal",
+    "dragon": "fairy",
+}
+
+
+def _build_chart() -> Tuple[Tuple[float, ...], ...]:
+    chart = [[1.0] * len(TYPES) for _ in TYPES]
+    for table, mult in (
+        (_SUPER, SUPER_EFFECTIVE),
+        (_RESISTED, NOT_VERY_EFFECTIVE),
+        (_IMMUNE, IMMUNE),
+    ):
+        for atk, defenders in table.items():
+            for d in defenders.split():
+                chart[TYPE_INDEX[atk]][TYPE_INDEX[d]] = mult
+    return tuple(tuple(row) for row in chart)
+
+
+# EFFECTIVENESS[attacking][defending] for single types (18 x 18).
+EFFECTIVENESS = _build_chart()
+
+# Every defensive typing: 18 single types followed by the 153 unordered dual types.
+TYPINGS: Tuple[Tuple[int, ...], ...] = tuple(
+    [(i,) for i in range(len(TYPES))] + list(combinations(range(len(TYPES)), 2))
+)
+TYPING_INDEX: Dict[Tuple[int, ...], int] = {t: i for i, t in enumerate(TYPINGS)}
+
+# TYPING_EFFECTIVENESS[attacking][typing] (18 x 171): product over the defender's types.
+TYPING_EFFECTIVENESS: Tuple[Tuple[float, ...], ...] = tuple(
+    tuple(
+        EFFECTIVENESS[a][t[0]] * (EFFECTIVENESS[a][t[1]] if len(t) > 1 else 1.0)
+        for t in TYPINGS
+    )
+    for a in range(len(TYPES))
+)
+_TYPING_EFFECTIVENESS_T = tuple(zip(*TYPING_EFFECTIVENESS))
+
+
+def _matvec(matrix: Sequence[Sequence[float]], vec: Sequence[float]) -> List[float]:
+    return [sum(map(mul, row, vec)) for row in matrix]
+
+
+def load_move_types(path: str | Path) -> Dict[str, str]:
+    """Load a `Move,Type` CSV (e.g. exported from the PvPoke gamemaster)."""
+    path = Path(path)
+    with path.open(newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        missing = {"Move", "Type"} - set(reader.fieldnames or [])
+        if missing:
+            raise ValueError(f"Missing required columns {missing} in {path}")
+        return {
+            row["Move"].strip(): row["Type"].strip().lower()
+            for row in reader
+            if row.get("Move") and row.get("Type")
+        }
+
+
+class TypeMatchupProcessor:
+    """Score how much pressure each attacking type and defensive typing faces in the meta.
+
+    Each snapshot is reduced to two score-weighted distributions:
+      * defenders: share of each of the 171 typings (from Type 1 / Type 2)
+      * attackers: share of each attacking type (the Pokémon's own types, or the
+        types of its fast / charged moves when `move_types` is given)
+
+    Two matrix-vector products against the precomputed 18 x 171 effectiveness
+    matrix then give:
+      * attack value: mean multiplier an attacking type deals to the meta
+      * defensive pressure: mean multiplier each typing takes from the meta
+
+    Both are compared old vs new; values above 1.0 mean advantaged / pressured.
+
+    output_top_n: rows shown per rising / falling list.
+    analyze_top_n: restrict BOTH snapshots to their top N by score.
+    move_types: optional move name -> type mapping (see `load_move_types`).
+    """
+
+    TYPE1_FIELD = "Type 1"
+    TYPE2_FIELD = "Type 2"
+    FAST_FIELD = "Fast Move"
+    CHARGED_FIELDS = ["Charged Move 1", "Charged Move 2"]
+
+    def __init__(
+        self,
+        output_top_n: int = 10,
+        analyze_top_n: int | None = None,
+        move_types: Optional[Mapping[str, str]] = None,
+    ):
+        self.output_top_n = output_top_n
+        self.analyze_top_n = analyze_top_n
+        self.move_types = move_types
+        self.unmapped_moves: set[str] = set()
+
+    def _scope(self, ds: RankingDataset) -> Iterable[RankingRecord]:
+        if self.analyze_top_n is None:
+            return ds.records.values()
+        return sorted(ds.records.values(), key=lambda r: r.score, reverse=True)[
+            : self.analyze_top_n
+        ]
+
+    def _typing(self, raw: Mapping[str, str]) -> Optional[Tuple[int, ...]]:
+        t1 = TYPE_INDEX.get((raw.get(self.TYPE1_FIELD) or "").strip().lower())
+        t2 = TYPE_INDEX.get((raw.get(self.TYPE2_FIELD) or "").strip().lower())
+        if t1 is None:
+            t1, t2 = t2, None
+        if t1 is None:
+            return None
+        if t2 is None or t2 == t1:
+            return (t1,)
+        return (t1, t2) if t1 < t2 else (t2, t1)
+
+    def _attack_types(
+        self, raw: Mapping[str, str], typing: Tuple[int, ...]
+    ) -> List[int]:
+        if self.move_types is None:
+            return list(typing)
+        found: List[int] = []
+        for f in [self.FAST_FIELD] + self.CHARGED_FIELDS:
+            move = (raw.get(f) or "").strip()
+            if not move:
+                continue
+            t = TYPE_INDEX.get(self.move_types.get(move, ""))
+            if t is None:
+                self.unmapped_moves.add(move)
+            else:
+                found.append(t)
+        # Fall back to STAB types when none of the moves could be mapped.
+        return found or list(typing)
+
+    def distributions(self, ds: RankingDataset) -> Tuple[List[float], List[float]]:
+        """Return (attacking type shares [18], defensive typing shares [171])."""
+        attackers = [0.0] * len(TYPES)
+        defenders = [0.0] * len(TYPINGS)
+        for rec in self._scope(ds):
+            typing = self._typing(rec.raw)
+            if typing is None or rec.score <= 0:
+                continue
+            defenders[TYPING_INDEX[typing]] += rec.score
+            atk = self._attack_types(rec.raw, typing)
+            share = rec.score / len(atk)
+            for t in atk:
+                attackers[t] += share
+        for dist in (attackers, defenders):
+            total = sum(dist)
+            if total:
+                dist[:] = [v / total for v in dist]
+        return attackers, defenders
+
+    def matchups(
+        self, ds: RankingDataset
+    ) -> Tuple[List[float], List[float], List[float]]:
+        """Return (attack value [18], defensive pressure [171], defender shares [171])."""
+        attackers, defenders = self.distributions(ds)
+        attack_value = _matvec(TYPING_EFFECTIVENESS, defenders)
+        pressure = _matvec(_TYPING_EFFECTIVENESS_T, attackers)
+        return attack_value, pressure, defenders
+
+    @staticmethod
+    def _typing_label(typing: Tuple[int, ...]) -> str:
+        return "/".join(TYPES[t] for t in typing)
+
+    def _section(
+        self,
+        lines: List[str],
+        title: str,
+        rows: List[Tuple[str, float, float, float]],
+        rising_label: str,
+        falling_label: str,
+    ) -> None:
+        rising = sorted((r for r in rows if r[3] > 0), key=lambda r: (-r[3], r[0]))
+        falling = sorted((r for r in rows if r[3] < 0), key=lambda r: (r[3], r[0]))
+        for label, items in ((rising_label, rising), (falling_label, falling)):
+            shown = items[: self.output_top_n]
+            lines.append("")
+            lines.append(f"{title} - {label} ({len(shown)} of {len(items)})")
+            for name, o, n, delta in shown:
+                lines.append(f"{delta:+7.3f} {name:<18} (x{o:.3f} -> x{n:.3f})")
+
+    def process(self, old: RankingDataset, new: RankingDataset) -> str:
+        self.unmapped_moves = set()
+        old_attack, old_pressure, old_share = self.matchups(old)
+        new_attack, new_pressure, new_share = self.matchups(new)
+
+        attack_rows = [
+            (TYPES[i], o, n, n - o)
+            for i, (o, n) in enumerate(zip(old_attack, new_attack))
+        ]
+        # Only typings actually present in either snapshot are reported.
+        pressure_rows = [
+            (self._typing_label(TYPINGS[i]), o, n, n - o)
+            for i, (o, n) in enumerate(zip(old_pressure, new_pressure))
+            if old_share[i] or new_share[i]
+        ]
+
+        scope_suffix = (
+            f" (top {self.analyze_top_n})" if self.analyze_top_n is not None else ""
+        )
+        source = "move types" if self.move_types is not None else "Pokémon types"
+        lines: List[str] = [
+            f"League: {new.league}",
+            f"Type Matchups vs Meta (score-weighted){scope_suffix}",
+            f"Attacking types taken from: {source}",
+            f"Typings present: {len(pressure_rows)}",
+        ]
+        self._section(
+            lines, "Attacking Types", attack_rows, "Gaining Value", "Losing Value"
+        )
+        self._section(
+            lines,
+            "Defensive Typings",
+            pressure_rows,
+            "Under More Pressure",
+            "Under Less Pressure",
+        )
+        if self.unmapped_moves:
+            lines.append("")
+            lines.append(
+                f"Moves without a type mapping ({len(self.unmapped_moves)}; "
+                "STAB types used when no move mapped): "
+                + ", ".join(sorted(self.unmapped_moves)[:30])
+                + ("..." if len(self.unmapped_moves) > 30 else "")
+            )
+        return "\n".join(lines)
@@ -0,0 +1,144 @@
+from __future__ import annotations
+import argparse
+import contextlib
+import io
+import json
+import os
+import signal
+import socketserver
+import sys
+import traceback
+from pathlib import Path
+from typing import Dict, Tuple
+from .client import default_socket_path, untrusted_reason
+from .loader import RankingsLoader
+from .main import run
+from .models import RankingDataset
+
+
+class WarmRankingsLoader(RankingsLoader):
+    """Loader that keeps parsed local CSVs in memory until the file changes.
+
+    Entries are keyed by resolved path and league and reused while the file's
+    mtime / size are unchanged. URL sources already reuse parsed datasets via
+    their ETag / Last-Modified (see `RankingsLoader`).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._warm: Dict[Tuple[str, str], Tuple[int, int, RankingDataset]] = {}
+
+    def _load_path(self, path, league, source) -> RankingDataset:
+        resolved = Path(path).resolve()
+        st = resolved.stat()
+        key = (str(resolved), league)
+        cached = self._warm.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        ds = super()._load_path(resolved, league, source)
+        self._warm[key] = (st.st_mtime_ns, st.st_size, ds)
+        return ds
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    # Requests are served one at a time, so a client that never finishes its
+    # request line must not block every later invocation.
+    timeout = 10
+
+    def handle(self):
+        try:
+            line = self.rfile.readline()
+        except TimeoutError:
+            return
+        try:
+            req = json.loads(line)
+            reply = self.server.execute(req["argv"], req["cwd"])
+        except Exception:
+            reply = {"status": 1, "stdout": "", "stderr": traceback.format_exc()}
+        self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+
+
+class AnalyzerServer(socketserver.UnixStreamServer):
+    """Resident worker running `main.run` requests against a warm loader.
+
+    Requests are handled one at a time: each run changes into the client's
+    working directory so relative paths and `output/` behave exactly as with
+    a local `python -m pogo_gbl_analyzer.main` invocation.
+    """
+
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+        self.loader = WarmRankingsLoader()
+        # Per-user directory for the default path; no-op for existing directories.
+        os.makedirs(
+            os.path.dirname(os.path.abspath(socket_path)), mode=0o700, exist_ok=True
+        )
+        reason = untrusted_reason(
+            socket_path, check_socket=os.path.lexists(socket_path)
+        )
+        if reason:
+            raise SystemExit(f"Refusing to listen on {socket_path}: {reason}")
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(socket_path)  # stale socket from a previous worker
+        # Create the socket owner-only from the start; chmod after bind leaves a window.
+        old_umask = os.umask(0o077)
+        try:
+            super().__init__(socket_path, _RequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def execute(self, argv, cwd: str) -> dict:
+        out, err = io.StringIO(), io.StringIO()
+        status = 0
+        prev_cwd = os.getcwd()
+        try:
+            os.chdir(cwd)
+            with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+                try:
+                    out_path = run(argv, loader=self.loader)
+                    print(f"[written] {out_path}")
+                except SystemExit as exc:
+                    # argparse / normalize_league exit paths, mirrored for the client.
+                    if isinstance(exc.code, str):
+                        print(exc.code, file=err)
+                        status = 1
+                    else:
+                        status = exc.code or 0
+                except Exception:
+                    traceback.print_exc()
+                    status = 1
+        finally:
+            os.chdir(prev_cwd)
+        return {"status": status, "stdout": out.getvalue(), "stderr": err.getvalue()}
+
+    def server_close(self):
+        super().server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.socket_path)
+
+
+def main():
+    p = argparse.ArgumentParser(
+        description="Resident worker keeping ranking datasets warm for pogo_gbl_analyzer.client."
+    )
+    p.add_argument(
+        "--socket",
+        default=default_socket_path(),
+        help=(
+            "Unix socket path (default: $POGO_GBL_SOCKET, "
+            "$XDG_RUNTIME_DIR/pogo-gbl-analyzer.sock or /tmp/pogo-gbl-analyzer-<uid>/worker.sock)"
+        ),
+    )
+    args = p.parse_args()
+    # Exit through the `with` block on `kill` too, so the socket file is removed.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    with AnalyzerServer(args.socket) as server:
+        print(f"[listening] {args.socket}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+from __future__ import annotations
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict, Iterator, List, Optional, Tuple
+from .models import RankingDataset
+
+# Block layout (all arrays are 8-byte items, so every section stays aligned):
+#   header   MAGIC, n_records, n_fields, n_strings, blob_len, league string id
+#   fields   n_fields          int64  string id of each raw column name
+#   scores   n_records         float64
+#   ranks    n_records         int64
+#   names    n_records         int64  string id of RankingRecord.pokemon
+#   cells    n_records*n_fields int64 string id of raw[field] (-1 = None)
+#   offsets  n_strings + 1     int64  start of each string in blob
+#   blob     blob_len bytes    UTF-8 string table (each distinct value stored once)
+_MAGIC = b"PGBLSHM1"
+_HEADER = struct.Struct("<8s5q")
+
+
+@dataclass(frozen=True)
+class SharedDatasetHandle:
+    """Picklable reference to a published dataset (pass this to workers)."""
+
+    name: str
+
+
+class SharedDatasetOwner:
+    """Owns the shared memory block created by `publish_dataset`.
+
+    Keep it alive while workers are attached; `close()` (or leaving the `with`
+    block) unlinks the block.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory):
+        self._shm: Optional[shared_memory.SharedMemory] = shm
+        self.handle = SharedDatasetHandle(shm.name)
+
+    def close(self) -> None:
+        if self._shm is not None:
+            self._shm.close()
+            if sys.version_info < (3, 13):
+                # Workers sharing our resource tracker (multiprocessing children)
+                # drop its entry when they unregister on attach; re-add it so
+                # unlink()'s own unregister finds it.
+                resource_tracker.register(self._shm._name, "shared_memory")
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass  # already removed (e.g. by another process)
+            self._shm = None
+
+    def __enter__(self) -> "SharedDatasetOwner":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def publish_dataset(ds: RankingDataset) -> SharedDatasetOwner:
+    """Copy `ds` once into a new shared memory block (numeric columns + string table)."""
+    strings: Dict[str, int] = {}
+
+    def intern(value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        sid = strings.get(value)
+        if sid is None:
+            sid = strings[value] = len(strings)
+        return sid
+
+    recs = list(ds.records.values())
+    fields: List[str] = []
+    seen_fields = set()
+    for rec in recs:
+        for f in rec.raw:
+            # DictReader stores overflow cells under a None key; they are not columns.
+            if f is not None and f not in seen_fields:
+                seen_fields.add(f)
+                fields.append(f)
+
+    league_id = intern(ds.league)
+    field_ids = array("q", map(intern, fields))
+    scores = array("d", (r.score for r in recs))
+    ranks = array("q", (r.rank for r in recs))
+    names = array("q", (intern(r.pokemon) for r in recs))
+    cells = array("q")
+    for rec in recs:
+        raw = rec.raw
+        cells.extend(intern(raw.get(f)) for f in fields)
+
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = array("q", [0])
+    for b in encoded:
+        offsets.append(offsets[-1] + len(b))
+    blob = b"".join(encoded)
+
+    header = _HEADER.pack(
+        _MAGIC, len(recs), len(fields), len(encoded), len(blob), league_id
+    )
+    sections = [header]
+    sections.extend(
+        a.tobytes() for a in (field_ids, scores, ranks, names, cells, offsets)
+    )
+    sections.append(blob)
+    size = sum(len(s) for s in sections)
+
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    pos = 0
+    for s in sections:
+        shm.buf[pos : pos + len(s)] = s
+        pos += len(s)
+    return SharedDatasetOwner(shm)
+
+
+class _SharedRow(Mapping):
+    """Read-only `raw` mapping for one record, decoding cells on access."""
+
+    __slots__ = ("_view", "_i")
+
+    def __init__(self, view: "SharedRankingDataset", i: int):
+        self._view = view
+        self._i = i
+
+    def __getitem__(self, field: str) -> Optional[str]:
+        v = self._view
+        col = v._field_index[field]
+        return v._string(v._cells[self._i * v._n_fields + col])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._view.fields)
+
+    def __len__(self) -> int:
+        return self._view._n_fields
+
+
+class SharedRankingRecord:
+    """Record view with the `RankingRecord` attribute interface."""
+
+    __slots__ = ("_view", "_i")
+
+    def __init__(self, view: "SharedRankingDataset", i: int):
+        self._view = view
+        self._i = i
+
+    @property
+    def pokemon(self) -> str:
+        return self._view._string(self._view._names[self._i])
+
+    @property
+    def score(self) -> float:
+        return self._view.scores[self._i]
+
+    @property
+    def rank(self) -> int:
+        return self._view.ranks[self._i]
+
+    @property
+    def raw(self) -> _SharedRow:
+        return _SharedRow(self._view, self._i)
+
+    @property
+    def name_key(self) -> str:
+        return self.pokemon
+
+    def __repr__(self) -> str:
+        return f"SharedRankingRecord(pokemon={self.pokemon!r}, score={self.score}, rank={self.rank})"
+
+
+class _SharedRecords(Mapping):
+    """`records` mapping keyed by name_key, in original dataset order."""
+
+    def __init__(self, view: "SharedRankingDataset"):
+        self._view = view
+        self._recs = [SharedRankingRecord(view, i) for i in range(view._n_records)]
+        self._index: Optional[Dict[str, int]] = None
+
+    def _key_index(self) -> Dict[str, int]:
+        if self._index is None:
+            self._index = {r.name_key: i for i, r in enumerate(self._recs)}
+        return self._index
+
+    def __getitem__(self, key: str) -> SharedRankingRecord:
+        return self._recs[self._key_index()[key]]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._key_index()
+
+    def __iter__(self) -> Iterator[str]:
+        return (r.name_key for r in self._recs)
+
+    def __len__(self) -> int:
+        return len(self._recs)
+
+    def values(self) -> List[SharedRankingRecord]:  # type: ignore[override]
+        return list(self._recs)
+
+    def items(self) -> List[Tuple[str, SharedRankingRecord]]:  # type: ignore[override]
+        return [(r.name_key, r) for r in self._recs]
+
+
+class SharedRankingDataset:
+    """Read-only, zero-copy view of a published dataset.
+
+    Mirrors the `RankingDataset` interface (`league`, `records`, `get`) so
+    existing processors run unchanged. `scores` and `ranks` expose the numeric
+    columns directly as memoryviews over the shared block.
+    """
+
+    def __init__(self, handle: SharedDatasetHandle):
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=handle.name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=handle.name)
+            # Before 3.13 attaching registers the block with this process's
+            # resource tracker, which would unlink it when this process exits.
+            resource_tracker.unregister(shm._name, "shared_memory")
+        self._shm: Optional[shared_memory.SharedMemory] = shm
+        buf = shm.buf
+        magic, n_rec, n_fields, n_strings, blob_len, league_id = _HEADER.unpack_from(
+            buf
+        )
+        if magic != _MAGIC:
+            shm.close()
+            raise ValueError(
+                f"Shared memory block {handle.name} is not a ranking dataset"
+            )
+        self._n_records = n_rec
+        self._n_fields = n_fields
+
+        pos = _HEADER.size
+        self._views: List[memoryview] = []
+
+        def readonly(mv: memoryview) -> memoryview:
+            # Keep the writable view too so close() can release it.
+            self._views.append(mv)
+            ro = mv.toreadonly()
+            self._views.append(ro)
+            return ro
+
+        def take(count: int, fmt: str) -> memoryview:
+            nonlocal pos
+            mv = readonly(buf[pos : pos + count * 8].cast(fmt))
+            pos += count * 8
+            return mv
+
+        field_ids = take(n_fields, "q")
+        self.scores = take(n_rec, "d")
+        self.ranks = take(n_rec, "q")
+        self._names = take(n_rec, "q")
+        self._cells = take(n_rec * n_fields, "q")
+        self._offsets = take(n_strings + 1, "q")
+        self._blob = readonly(buf[pos : pos + blob_len])
+        self._decoded: List[Optional[str]] = [None] * n_strings
+
+        self.league = self._string(league_id)
+        self.fields = [self._string(i) for i in field_ids]
+        self._field_index = {f: i for i, f in enumerate(self.fields)}
+        self.records = _SharedRecords(self)
+
+    def _string(self, sid: int) -> Optional[str]:
+        if sid < 0:
+            return None
+        s = self._decoded[sid]
+        if s is None:
+            start, end = self._offsets[sid], self._offsets[sid + 1]
+            s = self._decoded[sid] = str(self._blob[start:end], "utf-8")
+        return s
+
+    def get(self, key: str) -> Optional[SharedRankingRecord]:
+        return self.records.get(key)
+
+    def close(self) -> None:
+        if self._shm is None:
+            return
+        for mv in reversed(self._views):
+            mv.release()
+        self._views.clear()
+        self._shm.close()
+        self._shm = None
+
+    def __enter__(self) -> "SharedRankingDataset":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def attach_dataset(handle: SharedDatasetHandle) -> SharedRankingDataset:
+    """Attach read-only to a dataset published by another process."""
+    return SharedRankingDataset(handle)
+
+
+def process_shared(
+    processor, old: SharedDatasetHandle, new: SharedDatasetHandle
+) -> str:
+    """Worker entry point: attach to both snapshots and run `processor`.
+
+    Only the processor's parameters and two handles are pickled, e.g.
+    `pool.starmap(process_shared, [(proc, old_owner.handle, new_owner.handle), ...])`.
+    """
+    with attach_dataset(old) as old_ds, attach_dataset(new) as new_ds:
+        return processor.process(old_ds, new_ds)